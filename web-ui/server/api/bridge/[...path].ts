@@ -7,6 +7,13 @@ import { defineEventHandler, getQuery, readBody, getRequestHeaders, createError
  * Usage: /api/bridge/{path}?host=127.0.0.1&port=18773
  * e.g.   /api/bridge/v1/health?host=127.0.0.1&port=18773
  */
+
+// 所有请求的头完全一致，提升到模块级避免每次请求重建对象
+const BRIDGE_HEADERS = {
+  'Accept': 'application/json',
+  'Content-Type': 'application/json',
+} as const
+
 export default defineEventHandler(async (event) => {
   const method = event.method || 'GET'
   const params = event.context.params || {}
@@ -20,10 +27,7 @@ export default defineEventHandler(async (event) => {
 
   const fetchOpts: RequestInit = {
     method,
-    headers: {
-      'Accept': 'application/json',
-      'Content-Type': 'application/json',
-    },
+    headers: BRIDGE_HEADERS,
     signal: AbortSignal.timeout(30000),
   }
 
@@ -1,10 +1,5 @@
 import { defineEventHandler, readBody } from 'h3'
-import * as fs from 'fs'
-import * as path from 'path'
-import * as os from 'os'
-
-const CONFIG_DIR = path.join(os.homedir(), '.cgtools')
-const CONFIG_FILE = path.join(CONFIG_DIR, 'claude_configs.json')
+import { readConfigs, saveConfigs } from '../../utils/claudeConfigStore'
 
 export default defineEventHandler(async (event) => {
     const body = await readBody(event)
@@ -14,14 +9,7 @@ export default defineEventHandler(async (event) => {
         throw createError({ statusCode: 400, statusMessage: 'Missing name or config' })
     }
 
-    let configs = []
-    if (fs.existsSync(CONFIG_FILE)) {
-        try {
-            configs = JSON.parse(fs.readFileSync(CONFIG_FILE, 'utf-8'))
-        } catch (e) {
-            // ignore
-        }
-    }
+    const configs = await readConfigs()
 
     const existingConfig = configs.find(c => c.name === name)
     if (existingConfig) {
@@ -30,6 +18,6 @@ export default defineEventHandler(async (event) => {
         configs.push({ name, config })
     }
 
-    fs.writeFileSync(CONFIG_FILE, JSON.stringify(configs, null, 4))
+    await saveConfigs(configs)
     return { success: true }
 })
@@ -1,14 +1,9 @@
 import { defineEventHandler } from 'h3'
-import * as fs from 'fs'
-import * as path from 'path'
-import * as os from 'os'
 import { exec } from 'child_process'
 import { promisify } from 'util'
+import { readConfigs, writeActiveName } from '../../../utils/claudeConfigStore'
 
 const execAsync = promisify(exec)
-const CONFIG_DIR = path.join(os.homedir(), '.cgtools')
-const CONFIG_FILE = path.join(CONFIG_DIR, 'claude_configs.json')
-const ACTIVE_FILE = path.join(CONFIG_DIR, 'active_claude_config')
 
 export default defineEventHandler(async (event) => {
     const name = event.context.params.name
@@ -17,14 +12,7 @@ export default defineEventHandler(async (event) => {
         throw createError({ statusCode: 400, statusMessage: 'Missing config name' })
     }
 
-    let configs = []
-    if (fs.existsSync(CONFIG_FILE)) {
-        try {
-            configs = JSON.parse(fs.readFileSync(CONFIG_FILE, 'utf-8'))
-        } catch (e) {
-            // ignore
-        }
-    }
+    const configs = await readConfigs()
 
     const targetConfig = configs.find(c => c.name === name)
     if (!targetConfig) {
@@ -33,7 +21,7 @@ export default defineEventHandler(async (event) => {
 
     try {
         // 写入活跃标识文件
-        fs.writeFileSync(ACTIVE_FILE, name)
+        await writeActiveName(name)
 
         // Windows: Set User Environment Variables
         if (process.platform === 'win32') {
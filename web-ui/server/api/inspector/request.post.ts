@@ -64,21 +64,26 @@ function sendInspectorRequest(host: string, port: number, timeoutMs: number, req
       chunks.push(dataChunk)
       receivedBytes += dataChunk.length
 
-      const buffer = Buffer.concat(chunks, receivedBytes)
-      if (expectedPayloadBytes === null && buffer.length >= 4) {
-        const hasMagic = buffer.subarray(0, 4).equals(FRAME_MAGIC)
-        if (hasMagic && buffer.length < 8) {
+      // 只凭累计字节数判断是否收齐，避免每个 chunk 都重新拼接整个缓冲区（O(n^2)）
+      if (expectedPayloadBytes === null) {
+        if (receivedBytes < 4) {
+          return
+        }
+        const head = chunks.length === 1 ? chunks[0] : Buffer.concat(chunks, Math.min(receivedBytes, 8))
+        const hasMagic = head.subarray(0, 4).equals(FRAME_MAGIC)
+        if (hasMagic && receivedBytes < 8) {
           return
         }
         responseHeaderBytes = hasMagic ? 8 : 4
-        expectedPayloadBytes = buffer.readUInt32BE(hasMagic ? 4 : 0)
+        expectedPayloadBytes = head.readUInt32BE(hasMagic ? 4 : 0)
         if (expectedPayloadBytes <= 0 || expectedPayloadBytes > MAX_PAYLOAD_BYTES) {
           finishReject(new Error(`Invalid response payload size: ${expectedPayloadBytes}`))
           return
         }
       }
 
-      if (expectedPayloadBytes !== null && buffer.length >= expectedPayloadBytes + responseHeaderBytes) {
+      if (receivedBytes >= expectedPayloadBytes + responseHeaderBytes) {
+        const buffer = chunks.length === 1 ? chunks[0] : Buffer.concat(chunks, receivedBytes)
         const payload = buffer.subarray(responseHeaderBytes, responseHeaderBytes + expectedPayloadBytes).toString('utf8')
         try {
           finishResolve(JSON.parse(payload))
@@ -1,8 +1,10 @@
 // POST /api/knowledge/rebuild - 重建索引（现在其实就是重新查库）
-import { buildKnowledgeIndex } from '../../utils/knowledgeCards'
+import { buildKnowledgeIndex, invalidateKnowledgeIndexCache } from '../../utils/knowledgeCards'
 
 export default defineEventHandler(async () => {
   try {
+    // 手动 rebuild 的语义就是强制重来，先把内存缓存丢掉
+    invalidateKnowledgeIndexCache()
     const index = buildKnowledgeIndex()
     return {
       ok: true,
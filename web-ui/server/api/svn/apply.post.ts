@@ -392,6 +392,8 @@ export default defineEventHandler(async (event) => {
     const patchFileName = `svn_patch_${Date.now()}_r${revision || 'unk'}.patch`
     const patchFilePath = path.join(tempDir, patchFileName)
     let processedContent = patchContent
+    // 分类索引在 try 外持有，失败路径直接复用，不再对整个 patch 重新扫描一遍
+    let classificationIndex: PatchClassificationIndex = new Map()
 
     try {
         // svn diff -c 对本地工作副本产生的 patch 中路径是相对于 sourcePath 的绝对/相对路径
@@ -406,7 +408,7 @@ export default defineEventHandler(async (event) => {
                 .replaceAll(normalizedSource, normalizedTarget)
                 .replaceAll(sourceBackSlash, targetBackSlash)
         }
-        const classificationIndex = buildPatchClassificationIndex(processedContent)
+        classificationIndex = buildPatchClassificationIndex(processedContent)
         fs.writeFileSync(patchFilePath, processedContent, 'utf-8')
 
         const cmd = `chcp 65001 >nul && svn patch "${patchFilePath}" "${sanitizedTargetDir}"`
@@ -426,7 +428,6 @@ export default defineEventHandler(async (event) => {
 
         const stdout = error.stdout || ''
         const stderr = error.stderr || ''
-        const classificationIndex = buildPatchClassificationIndex(processedContent)
         const parsed = parseSvnPatchOutput([stdout, stderr].filter(Boolean).join('\n'), classificationIndex)
 
         if (parsed.files.length > 0 || parsed.conflicts.length > 0 || parsed.skipped.length > 0) {
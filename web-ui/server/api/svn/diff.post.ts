@@ -1,8 +1,6 @@
 import { defineEventHandler, readBody } from 'h3'
-import { exec } from 'child_process'
-import { promisify } from 'util'
-
-const execAsync = promisify(exec)
+import { fetchSvnInfo } from '../../utils/svnInfo'
+import { runSvn } from '../../utils/svnCli'
 
 export default defineEventHandler(async (event) => {
     const body = await readBody(event)
@@ -14,7 +12,7 @@ export default defineEventHandler(async (event) => {
 
     // Sanitize URL for Windows: remove trailing backslash which escapes the closing quote
     const sanitizedUrl = url.replace(/\\$/, '')
-    let cmd = ''
+    let args: string[] = []
 
     try {
         if (fromRepoRoot) {
@@ -27,27 +25,17 @@ export default defineEventHandler(async (event) => {
             const isUrl = /^(svn|https?):\/\//i.test(sanitizedUrl)
             let root = ''
 
-            if (!isUrl) {
-                // For local paths, try to get the Working Copy root first (safer for permissions)
-                try {
-                    const { stdout: wcRoot } = await execAsync(`chcp 65001 >nul && svn info --show-item wc-root "${sanitizedUrl}"`, { encoding: 'utf-8' })
-                    root = wcRoot.trim()
-                } catch (e) {
-                    // Fallback to repos-root-url if not in a working copy
-                }
-            }
-
-            if (!root) {
-                // Get the server-side repository root URL
-                const { stdout: repoRoot } = await execAsync(`chcp 65001 >nul && svn info --show-item repos-root-url "${sanitizedUrl}"`, { encoding: 'utf-8' })
-                root = repoRoot.trim()
-            }
+            // 一次 svn info 同时拿 Working Copy Root 和 Repository Root，
+            // 本地路径优先用 WC root（权限更稳），否则回退仓库根 URL。
+            // svn info 本身失败不在这里吞掉，让外层 catch 做 E175013 等针对性提示
+            const info = await fetchSvnInfo(sanitizedUrl)
+            root = (!isUrl && info.wcRoot) ? info.wcRoot : (info.reposRoot || '')
 
             if (!root) {
                 return { success: false, error: '无法获取 SVN 根路径，请检查路径是否正确' }
             }
 
-            cmd = `chcp 65001 >nul && svn diff -r ${prevRev}:${revision} "${root}" --non-interactive`
+            args = ['diff', '-r', `${prevRev}:${revision}`, root, '--non-interactive']
         } else if (parentLevels && parentLevels > 0) {
             let parentUrl = sanitizedUrl
             for (let i = 0; i < parentLevels; i++) {
@@ -58,12 +46,12 @@ export default defineEventHandler(async (event) => {
                 return { success: false, error: 'Invalid revision number' }
             }
             const prevRev = revNum - 1
-            cmd = `chcp 65001 >nul && svn diff -r ${prevRev}:${revision} "${parentUrl}" --non-interactive`
+            args = ['diff', '-r', `${prevRev}:${revision}`, parentUrl, '--non-interactive']
         } else {
-            cmd = `chcp 65001 >nul && svn diff -c ${revision} "${sanitizedUrl}" --non-interactive`
+            args = ['diff', '-c', String(revision), sanitizedUrl, '--non-interactive']
         }
 
-        const { stdout, stderr } = await execAsync(cmd, { encoding: 'utf-8', maxBuffer: 10 * 1024 * 1024 })
+        const { stdout, stderr } = await runSvn(args, { maxBuffer: 10 * 1024 * 1024 })
         if (stderr && !stdout) {
             // Check for specific permission error
             if (stderr.includes('E175013')) {
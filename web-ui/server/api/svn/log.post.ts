@@ -1,8 +1,5 @@
 import { defineEventHandler, readBody, getQuery } from 'h3'
-import { exec } from 'child_process'
-import { promisify } from 'util'
-
-const execAsync = promisify(exec)
+import { runSvn } from '../../utils/svnCli'
 
 export default defineEventHandler(async (event) => {
     // Can be GET or POST based on frontend
@@ -30,7 +27,7 @@ export default defineEventHandler(async (event) => {
     const sanitizedUrl = urlStr.replace(/\\$/, '')
 
     try {
-        const { stdout, stderr } = await execAsync(`chcp 65001 >nul && svn log -r ${revStr} "${sanitizedUrl}" --non-interactive`, { encoding: 'utf-8' })
+        const { stdout, stderr } = await runSvn(['log', '-r', revStr, sanitizedUrl, '--non-interactive'])
         if (stderr && !stdout) {
             return { success: false, error: stderr.trim() }
         }
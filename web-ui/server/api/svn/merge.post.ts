@@ -1,8 +1,6 @@
 import { defineEventHandler, readBody } from 'h3'
-import { exec } from 'child_process'
-import { promisify } from 'util'
-
-const execAsync = promisify(exec)
+import { fetchSvnInfo } from '../../utils/svnInfo'
+import { runSvn } from '../../utils/svnCli'
 
 interface MergeResult {
     updated: string[]
@@ -43,17 +41,13 @@ async function getSvnUrl(localPath: string): Promise<string> {
         return localPath
     }
 
-    const { stdout } = await execAsync(`chcp 65001 >nul && svn info "${localPath}"`, {
-        encoding: 'utf-8',
-        maxBuffer: 1024 * 1024
-    })
-
-    // Extract "URL: ..." line
-    const match = stdout.match(/^URL:\s*(.+)$/m)
-    if (!match) {
+    // merge 要拿着这个 URL 改工作副本，svn switch 过的路径拿到旧 URL 会合错分支，
+    // 所以这里强制 fresh，不吃 TTL 缓存
+    const info = await fetchSvnInfo(localPath, { fresh: true })
+    if (!info.url) {
         throw new Error(`无法从 svn info 获取 URL。路径: ${localPath}`)
     }
-    return match[1].trim()
+    return info.url
 }
 
 export default defineEventHandler(async (event) => {
@@ -73,12 +67,10 @@ export default defineEventHandler(async (event) => {
         const sourceUrl = await getSvnUrl(sanitizedSourcePath)
 
         // Step 2: Execute svn merge
-        const cmd = `chcp 65001 >nul && svn merge -c ${revision} "${sourceUrl}" "${sanitizedTargetDir}" --non-interactive --accept postpone`
-
-        const { stdout, stderr } = await execAsync(cmd, {
-            encoding: 'utf-8',
-            maxBuffer: 10 * 1024 * 1024
-        })
+        const { stdout, stderr } = await runSvn(
+            ['merge', '-c', String(revision), sourceUrl, sanitizedTargetDir, '--non-interactive', '--accept', 'postpone'],
+            { maxBuffer: 10 * 1024 * 1024 }
+        )
 
         const output = stdout || ''
         const parsed = parseSvnMergeOutput(output)
@@ -1,11 +1,23 @@
-import { readFile } from 'node:fs/promises'
+import { readFile, stat } from 'node:fs/promises'
 import { defineEventHandler, setHeader } from 'h3'
 
 const TABLE_VIEWER_HTML_PATH = 'E:/CJGame/trunk/xls/table_viewer/table_viewer.html'
 
+// 页面内容按 mtime+size 缓存在内存里，文件没重新生成时每次请求只付一次 stat。
+// 对外仍保持 no-store：浏览器每次都来问，但磁盘读取只在文件变化后发生
+let htmlCache: { key: string; html: string } | null = null
+
 export default defineEventHandler(async (event) => {
   setHeader(event, 'content-type', 'text/html; charset=utf-8')
   setHeader(event, 'cache-control', 'no-store')
 
-  return await readFile(TABLE_VIEWER_HTML_PATH, 'utf-8')
+  const fileStat = await stat(TABLE_VIEWER_HTML_PATH)
+  const key = `${fileStat.mtimeMs}:${fileStat.size}`
+  if (htmlCache && htmlCache.key === key) {
+    return htmlCache.html
+  }
+
+  const html = await readFile(TABLE_VIEWER_HTML_PATH, 'utf-8')
+  htmlCache = { key, html }
+  return html
 })
@@ -85,6 +85,72 @@ const resolveUeConsoleCommand = (data: Record<string, unknown>) => {
     }
 }
 
+// 子进程环境在进程生命周期内不变，启动时合并一次，三种运行模式共用
+const RUNNER_ENV = { ...process.env, PYTHONIOENCODING: 'utf-8', CGTOOLS_WEB_RUNNER: '1' }
+
+// 输出积攒多久/多大后合并成一帧下发。逐行刷屏的脚本不再每行付一次 JSON 编码 + WebSocket 帧
+const FLUSH_INTERVAL_MS = 20
+const FLUSH_THRESHOLD_CHARS = 64 * 1024
+
+// stdout/stderr 帧的信封是固定的，提前序列化好前缀，热路径上只需编码 data 字符串本身。
+// start/end/error 这类低频帧仍走完整的 JSON.stringify
+const FRAME_PREFIX = {
+    stdout: '{"type":"stdout","data":',
+    stderr: '{"type":"stderr","data":',
+} as const
+
+// 三种运行模式共用同一套输出转发逻辑，集中在一处便于后续统一优化
+const wireScriptProcess = (peer: { id: string; send: (data: string) => void }, proc: ReturnType<typeof spawn>, name: string) => {
+    activeProcesses.set(peer.id, proc)
+
+    peer.send(JSON.stringify({ type: 'start', script: name }))
+
+    const buffers: Record<'stdout' | 'stderr', string[]> = { stdout: [], stderr: [] }
+    let buffered = 0
+    let flushTimer: NodeJS.Timeout | null = null
+
+    const flush = () => {
+        if (flushTimer) {
+            clearTimeout(flushTimer)
+            flushTimer = null
+        }
+        for (const type of ['stdout', 'stderr'] as const) {
+            const parts = buffers[type]
+            if (parts.length === 0) continue
+            const data = parts.length === 1 ? parts[0] : parts.join('')
+            parts.length = 0
+            peer.send(FRAME_PREFIX[type] + JSON.stringify(data) + '}')
+        }
+        buffered = 0
+    }
+
+    const push = (type: 'stdout' | 'stderr', chunk: Buffer) => {
+        const text = chunk.toString('utf-8')
+        buffers[type].push(text)
+        buffered += text.length
+        if (buffered >= FLUSH_THRESHOLD_CHARS) {
+            flush()
+        } else if (!flushTimer) {
+            flushTimer = setTimeout(flush, FLUSH_INTERVAL_MS)
+        }
+    }
+
+    proc.stdout?.on('data', (chunk) => push('stdout', chunk))
+    proc.stderr?.on('data', (chunk) => push('stderr', chunk))
+
+    proc.on('close', (code) => {
+        flush()
+        peer.send(JSON.stringify({ type: 'end', exitCode: code }))
+        activeProcesses.delete(peer.id)
+    })
+
+    proc.on('error', (err) => {
+        flush()
+        peer.send(JSON.stringify({ type: 'error', data: err.message }))
+        activeProcesses.delete(peer.id)
+    })
+}
+
 export default defineWebSocketHandler({
     open(peer) {
         console.log('[ws] peer connected', peer.id)
@@ -106,30 +172,10 @@ export default defineWebSocketHandler({
                     const { cmd, args, cwd, name } = resolveUeConsoleCommand(data)
                     const proc = spawn(cmd, args, {
                         cwd,
-                        env: { ...process.env, PYTHONIOENCODING: 'utf-8', CGTOOLS_WEB_RUNNER: '1' }
-                    })
-
-                    activeProcesses.set(peer.id, proc)
-
-                    peer.send(JSON.stringify({ type: 'start', script: name }))
-
-                    proc.stdout.on('data', (chunk) => {
-                        peer.send(JSON.stringify({ type: 'stdout', data: chunk.toString('utf-8') }))
+                        env: RUNNER_ENV
                     })
 
-                    proc.stderr.on('data', (chunk) => {
-                        peer.send(JSON.stringify({ type: 'stderr', data: chunk.toString('utf-8') }))
-                    })
-
-                    proc.on('close', (code) => {
-                        peer.send(JSON.stringify({ type: 'end', exitCode: code }))
-                        activeProcesses.delete(peer.id)
-                    })
-
-                    proc.on('error', (err) => {
-                        peer.send(JSON.stringify({ type: 'error', data: err.message }))
-                        activeProcesses.delete(peer.id)
-                    })
+                    wireScriptProcess(peer, proc, name)
                     return
                 }
 
@@ -138,30 +184,10 @@ export default defineWebSocketHandler({
                     const { cmd, args, name } = resolveConsoleCommand(data)
                     const proc = spawn(cmd, args, {
                         cwd,
-                        env: { ...process.env, PYTHONIOENCODING: 'utf-8', CGTOOLS_WEB_RUNNER: '1' }
+                        env: RUNNER_ENV
                     })
 
-                    activeProcesses.set(peer.id, proc)
-
-                    peer.send(JSON.stringify({ type: 'start', script: name }))
-
-                    proc.stdout.on('data', (chunk) => {
-                        peer.send(JSON.stringify({ type: 'stdout', data: chunk.toString('utf-8') }))
-                    })
-
-                    proc.stderr.on('data', (chunk) => {
-                        peer.send(JSON.stringify({ type: 'stderr', data: chunk.toString('utf-8') }))
-                    })
-
-                    proc.on('close', (code) => {
-                        peer.send(JSON.stringify({ type: 'end', exitCode: code }))
-                        activeProcesses.delete(peer.id)
-                    })
-
-                    proc.on('error', (err) => {
-                        peer.send(JSON.stringify({ type: 'error', data: err.message }))
-                        activeProcesses.delete(peer.id)
-                    })
+                    wireScriptProcess(peer, proc, name)
                     return
                 }
 
@@ -196,30 +222,10 @@ export default defineWebSocketHandler({
 
                 const proc = spawn(cmd, args, {
                     cwd: path.dirname(scriptPath),
-                    env: { ...process.env, PYTHONIOENCODING: 'utf-8', CGTOOLS_WEB_RUNNER: '1' }
-                })
-
-                activeProcesses.set(peer.id, proc)
-
-                peer.send(JSON.stringify({ type: 'start', script: path.basename(scriptPath) }))
-
-                proc.stdout.on('data', (chunk) => {
-                    peer.send(JSON.stringify({ type: 'stdout', data: chunk.toString('utf-8') }))
-                })
-
-                proc.stderr.on('data', (chunk) => {
-                    peer.send(JSON.stringify({ type: 'stderr', data: chunk.toString('utf-8') }))
+                    env: RUNNER_ENV
                 })
 
-                proc.on('close', (code) => {
-                    peer.send(JSON.stringify({ type: 'end', exitCode: code }))
-                    activeProcesses.delete(peer.id)
-                })
-
-                proc.on('error', (err) => {
-                    peer.send(JSON.stringify({ type: 'error', data: err.message }))
-                    activeProcesses.delete(peer.id)
-                })
+                wireScriptProcess(peer, proc, path.basename(scriptPath))
 
             } else if (data.action === 'terminate') {
                 const proc = activeProcesses.get(peer.id)
@@ -0,0 +1,38 @@
+import assert from 'node:assert/strict'
+import { parseSvnInfo } from '../svnInfo.ts'
+
+const localInfoOutput = [
+  'Path: D:\\Work\\Survive',
+  'Working Copy Root Path: D:\\Work\\Survive',
+  'URL: https://svn.example.com/repo/trunk/Survive',
+  'Relative URL: ^/trunk/Survive',
+  'Repository Root: https://svn.example.com/repo',
+  'Repository UUID: 2f5c9a64-0000-0000-0000-000000000000',
+  'Revision: 12345',
+  'Node Kind: directory',
+].join('\n')
+
+const localFields = parseSvnInfo(localInfoOutput)
+assert.equal(localFields.wcRoot, 'D:\\Work\\Survive')
+assert.equal(localFields.url, 'https://svn.example.com/repo/trunk/Survive')
+assert.equal(localFields.reposRoot, 'https://svn.example.com/repo')
+assert.equal(localFields.revision, '12345')
+
+// 远端 URL 没有 Working Copy Root Path 一行
+const remoteInfoOutput = [
+  'Path: Survive',
+  'URL: https://svn.example.com/repo/trunk/Survive',
+  'Repository Root: https://svn.example.com/repo',
+  'Revision: 12346',
+].join('\n')
+
+const remoteFields = parseSvnInfo(remoteInfoOutput)
+assert.equal(remoteFields.wcRoot, undefined)
+assert.equal(remoteFields.reposRoot, 'https://svn.example.com/repo')
+
+// Windows 下的 \r\n 行尾不应该把回车混进字段值
+const crlfFields = parseSvnInfo('URL: https://svn.example.com/repo/trunk\r\nRevision: 7\r\n')
+assert.equal(crlfFields.url, 'https://svn.example.com/repo/trunk')
+assert.equal(crlfFields.revision, '7')
+
+assert.deepEqual(parseSvnInfo(''), {})
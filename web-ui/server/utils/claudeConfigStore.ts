@@ -0,0 +1,89 @@
+import * as fsp from 'fs/promises'
+import * as path from 'path'
+import * as os from 'os'
+
+export const CONFIG_DIR = path.join(os.homedir(), '.cgtools')
+export const CONFIG_FILE = path.join(CONFIG_DIR, 'claude_configs.json')
+export const ACTIVE_FILE = path.join(CONFIG_DIR, 'active_claude_config')
+
+export type ClaudeConfigEntry = {
+    name: string
+    config: {
+        baseApi?: string
+        authToken?: string
+        [key: string]: unknown
+    }
+}
+
+export async function ensureConfigDir() {
+    await fsp.mkdir(CONFIG_DIR, { recursive: true })
+}
+
+// 解析结果按文件 mtime 缓存；文件没动过时读取只花一次 stat。
+// 对外仍返回深拷贝，调用方可以放心原地改（configs.post 就是这么用的）
+let configsCache: { mtimeMs: number; configs: ClaudeConfigEntry[] } | null = null
+
+export async function readConfigs(): Promise<ClaudeConfigEntry[]> {
+    let mtimeMs = -1
+    try {
+        mtimeMs = (await fsp.stat(CONFIG_FILE)).mtimeMs
+    } catch {
+        configsCache = null
+        return []
+    }
+
+    if (configsCache && configsCache.mtimeMs === mtimeMs) {
+        return structuredClone(configsCache.configs)
+    }
+
+    try {
+        const configs = JSON.parse(await fsp.readFile(CONFIG_FILE, 'utf-8'))
+        configsCache = { mtimeMs, configs: structuredClone(configs) }
+        return configs
+    } catch {
+        // 内容损坏按空列表处理，和旧行为一致
+        return []
+    }
+}
+
+export async function readActiveName(): Promise<string> {
+    try {
+        return (await fsp.readFile(ACTIVE_FILE, 'utf-8')).trim()
+    } catch {
+        return ''
+    }
+}
+
+export async function writeActiveName(name: string) {
+    await ensureConfigDir()
+    await fsp.writeFile(ACTIVE_FILE, name)
+}
+
+export async function clearActiveName() {
+    try {
+        await fsp.unlink(ACTIVE_FILE)
+    } catch {
+        // 不存在就算了
+    }
+}
+
+// 先写同目录临时文件再 rename 原子替换，进程中途退出不会留下写了一半的 JSON
+export async function saveConfigs(configs: ClaudeConfigEntry[]) {
+    await ensureConfigDir()
+    const tmp = `${CONFIG_FILE}.${process.pid}.tmp`
+    try {
+        // 这个文件只被本工具读写，紧凑格式省掉缩进的编码/解析和多写的字节
+        await fsp.writeFile(tmp, JSON.stringify(configs))
+        await fsp.rename(tmp, CONFIG_FILE)
+    } catch (e) {
+        try { await fsp.unlink(tmp) } catch { }
+        throw e
+    }
+
+    // 写完顺手回填缓存，下一次读取连 JSON.parse 都省了
+    try {
+        configsCache = { mtimeMs: (await fsp.stat(CONFIG_FILE)).mtimeMs, configs: structuredClone(configs) }
+    } catch {
+        configsCache = null
+    }
+}
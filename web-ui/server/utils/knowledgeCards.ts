@@ -1,6 +1,6 @@
 // 知识卡片 - 直接以 Obsidian knowledge-cards 目录作为唯一数据源
 import { basename, extname, join, normalize, resolve } from 'path'
-import { existsSync, mkdirSync, readFileSync, readdirSync, unlinkSync, writeFileSync } from 'fs'
+import { existsSync, mkdirSync, readFileSync, readdirSync, statSync, unlinkSync, writeFileSync } from 'fs'
 
 export const KNOWLEDGE_CARDS_DIR =
   process.env.KNOWLEDGE_CARDS_DIR ||
@@ -196,6 +196,9 @@ function readNodeFromFile(filename: string): KnowledgeNodeRecord {
   }
 }
 
+// Vault 根目录下由 buildKnowledgeIndex 自愈维护的骨干文件
+const VAULT_BONE_FILES = ['01-知识体系索引.md', 'log.md']
+
 export function scanKnowledgeNodes() {
   const nodes = markdownFiles().map(readNodeFromFile)
   
@@ -203,8 +206,7 @@ export function scanKnowledgeNodes() {
   // 让它们参与脑网络图谱分析，精准消除因 MOC/Index 引用导致的孤立误判状态！
   try {
     const vaultRoot = resolve(KNOWLEDGE_CARDS_DIR, '..')
-    const boneFiles = ['01-知识体系索引.md', 'log.md']
-    for (const bf of boneFiles) {
+    for (const bf of VAULT_BONE_FILES) {
       const filePath = join(vaultRoot, bf)
       if (existsSync(filePath)) {
         const raw = readFileSync(filePath, 'utf8')
@@ -489,7 +491,54 @@ function generateObsidianLog(cards: KnowledgeCardRecord[]): string {
   return md
 }
 
+function writeIfChanged(filePath: string, content: string) {
+  try {
+    if (existsSync(filePath) && readFileSync(filePath, 'utf8') === content) {
+      return
+    }
+  } catch {
+    // 读取失败就按有变更处理，直接写
+  }
+  writeFileSync(filePath, content, 'utf8')
+}
+
+// 索引缓存：用卡片目录里 .md 文件 + 根目录骨干文件的数量与最新 mtime 作为变更指纹。
+// 命中时只付出 N 次 stat，而不是 N 次整文件读取 + frontmatter 解析
+let indexCache: { fingerprint: string; index: KnowledgeIndex } | null = null
+
+// rebuild 接口用它强制下一次构建绕过缓存
+export function invalidateKnowledgeIndexCache() {
+  indexCache = null
+}
+
+function vaultFingerprint(): string {
+  const vaultRoot = resolve(KNOWLEDGE_CARDS_DIR, '..')
+  // 骨干文件也参与指纹：它们被删/被改后下一次构建就会自愈重建，
+  // 而不是等到某张卡片变动或进程重启
+  const tracked = [
+    ...markdownFiles().map(name => join(KNOWLEDGE_CARDS_DIR, name)),
+    ...VAULT_BONE_FILES.map(name => join(vaultRoot, name)),
+  ]
+  let latest = 0
+  for (const filePath of tracked) {
+    try {
+      const mtime = statSync(filePath).mtimeMs
+      if (mtime > latest) latest = mtime
+    } catch {
+      // 文件不在了（扫描间隙被删，或骨干文件待自愈），直接视为已变更
+      return `changed:${Date.now()}`
+    }
+  }
+  // 带上文件路径列表，重命名（mtime 不变）也能正确失效
+  return `${latest}:${tracked.join('|')}`
+}
+
 export function buildKnowledgeIndex(): KnowledgeIndex {
+  const fingerprint = vaultFingerprint()
+  if (indexCache && indexCache.fingerprint === fingerprint) {
+    return indexCache.index
+  }
+
   const nodes = scanKnowledgeNodes()
   const cards = nodes
     .filter(node => node.type === 'card')
@@ -497,23 +546,25 @@ export function buildKnowledgeIndex(): KnowledgeIndex {
     .sort((a, b) => b.id.localeCompare(a.id))
 
   // 自动自愈生成本地 Obsidian Vault 根目录下的 01-知识体系索引.md 与 log.md 文件
+  // 内容没变就不落盘，避免无谓写入反复触发 Obsidian/同步盘的文件监听
   try {
-    const indexContent = generateObsidianIndex(cards)
-    const logContent = generateObsidianLog(cards)
     const vaultRoot = resolve(KNOWLEDGE_CARDS_DIR, '..')
-    writeFileSync(join(vaultRoot, '01-知识体系索引.md'), indexContent, 'utf8')
-    writeFileSync(join(vaultRoot, 'log.md'), logContent, 'utf8')
+    writeIfChanged(join(vaultRoot, '01-知识体系索引.md'), generateObsidianIndex(cards))
+    writeIfChanged(join(vaultRoot, 'log.md'), generateObsidianLog(cards))
   } catch (err) {
     console.error('Failed to auto generate Obsidian Index/Log files:', err)
   }
 
-  return {
+  const index: KnowledgeIndex = {
     version: 2,
     updated_at: formatTimestamp(new Date()),
     vaultPath: KNOWLEDGE_CARDS_DIR,
     stats: statsForNodes(nodes),
     cards,
   }
+  // 自愈写入会刷新骨干文件的 mtime，重新取一次指纹，缓存才不会刚存就失效
+  indexCache = { fingerprint: vaultFingerprint(), index }
+  return index
 }
 
 export function getKnowledgeCard(id: string): KnowledgeCardRecord | null {
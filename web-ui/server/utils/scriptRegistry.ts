@@ -163,17 +163,38 @@ export const isSupportedScriptFile = (fileName: string) => {
   return Boolean(SCRIPT_ICONS[ext]) && !fileName.toLowerCase().includes('toolbox')
 }
 
+// 参数解析要整读脚本再做正则扫描，按 (mtime, size) 缓存结果：
+// 每次 GET /api/scripts 只为没变过的脚本付一次 stat，而不是读文件 + 重新解析
+const parameterCache = new Map<string, { key: string; params: ScriptParameterInfo[] }>()
+
 const getScriptParameters = (fileName: string, fullPath: string) => {
   if (path.extname(fileName).toLowerCase() !== '.ps1') {
     return []
   }
 
+  let cacheKey = ''
+  try {
+    const stat = fs.statSync(fullPath)
+    cacheKey = `${stat.mtimeMs}:${stat.size}`
+    const cached = parameterCache.get(fullPath)
+    if (cached && cached.key === cacheKey) {
+      return cached.params
+    }
+  } catch {
+    // stat 失败就退回直接读取
+  }
+
   const content = fs.readFileSync(fullPath, 'utf-8')
   const overrides = SCRIPT_PARAMETER_OVERRIDES[fileName] || {}
-  return parsePowerShellParameters(content).map((param) => ({
+  const params = parsePowerShellParameters(content).map((param) => ({
     ...param,
     ...(overrides[param.key] || {}),
   }))
+
+  if (cacheKey) {
+    parameterCache.set(fullPath, { key: cacheKey, params })
+  }
+  return params
 }
 
 export const resolveManagedScriptPath = (scriptPath: unknown) => {
@@ -205,20 +226,22 @@ export const listManagedScripts = () => {
   const scriptsDir = getScriptsDir()
   const scripts: ScriptInfo[] = []
 
-  if (!fs.existsSync(scriptsDir)) {
+  let entries: fs.Dirent[]
+  try {
+    // readdir 直接带回每一项的文件类型，省掉 existsSync 和每个文件一次 statSync
+    entries = fs.readdirSync(scriptsDir, { withFileTypes: true })
+  } catch {
     return scripts
   }
 
-  const files = fs.readdirSync(scriptsDir)
+  for (const entry of entries) {
+    const file = entry.name
 
-  for (const file of files) {
-    const fullPath = path.join(scriptsDir, file)
-    const stat = fs.statSync(fullPath)
-
-    if (!stat.isFile() || !isSupportedScriptFile(file)) {
+    if (!entry.isFile() || !isSupportedScriptFile(file)) {
       continue
     }
 
+    const fullPath = path.join(scriptsDir, file)
     const ext = path.extname(file).toLowerCase()
     const icon = SCRIPT_ICONS[ext]
     if (!icon) {
@@ -0,0 +1,30 @@
+import { exec, execFile } from 'child_process'
+import { promisify } from 'util'
+
+const execAsync = promisify(exec)
+const execFileAsync = promisify(execFile)
+
+export type SvnRunOptions = {
+  maxBuffer?: number
+}
+
+// 统一加引号并去掉结尾反斜杠——结尾的 \ 会把闭合引号转义掉（历史上踩过的坑）
+const quoteForCmd = (arg: string) => `"${String(arg).replace(/\\$/, '')}"`
+
+/**
+ * 统一的 svn 命令入口，参数一律以 argv 数组传入。
+ *
+ * Windows 上仍要经由 cmd 先跑 chcp 65001，否则中文系统下 svn 输出是 GBK 乱码，
+ * 所以那里只能拼接命令串，但引号处理集中在这一个地方；
+ * 其他平台直接 execFile 传 argv，不经过 shell，也就没有转义问题。
+ */
+export async function runSvn(args: string[], opts: SvnRunOptions = {}) {
+  const maxBuffer = opts.maxBuffer ?? 10 * 1024 * 1024
+
+  if (process.platform === 'win32') {
+    const cmd = `chcp 65001 >nul && svn ${args.map(quoteForCmd).join(' ')}`
+    return await execAsync(cmd, { encoding: 'utf-8', maxBuffer })
+  }
+
+  return await execFileAsync('svn', args, { encoding: 'utf-8', maxBuffer })
+}
@@ -0,0 +1,52 @@
+import { runSvn } from './svnCli'
+
+export type SvnInfoFields = {
+  url?: string
+  wcRoot?: string
+  reposRoot?: string
+  revision?: string
+}
+
+// 一次扫描提取所有关心的字段，调用方不必按字段各跑一次 svn info --show-item
+const INFO_LINE_RE = /^(URL|Working Copy Root Path|Repository Root|Revision):\s*(.+?)\s*$/gm
+
+const INFO_KEY_MAP: Record<string, keyof SvnInfoFields> = {
+  'URL': 'url',
+  'Working Copy Root Path': 'wcRoot',
+  'Repository Root': 'reposRoot',
+  'Revision': 'revision',
+}
+
+export function parseSvnInfo(stdout: string): SvnInfoFields {
+  const fields: SvnInfoFields = {}
+  for (const match of stdout.matchAll(INFO_LINE_RE)) {
+    fields[INFO_KEY_MAP[match[1]]] = match[2]
+  }
+  return fields
+}
+
+// 同一个路径/URL 的 info 结果在短时间内不会变（仓库根、WC 根基本是常量），
+// 按目标缓存几分钟，连续操作同一仓库时省掉反复起 svn 进程的开销。
+// 失败不进缓存：凭据补好或网络恢复后下一次就能成功
+const INFO_CACHE_TTL_MS = 5 * 60 * 1000
+const infoCache = new Map<string, { expiresAt: number; fields: SvnInfoFields }>()
+
+export type SvnInfoOptions = {
+  // 工作副本的 URL 会随 svn switch/relocate 变化，不像仓库根那样是常量。
+  // 依赖 URL 字段做写操作的调用方传 fresh 绕过缓存读取（结果仍回填缓存）
+  fresh?: boolean
+}
+
+export async function fetchSvnInfo(pathOrUrl: string, opts: SvnInfoOptions = {}): Promise<SvnInfoFields> {
+  if (!opts.fresh) {
+    const cached = infoCache.get(pathOrUrl)
+    if (cached && cached.expiresAt > Date.now()) {
+      return cached.fields
+    }
+  }
+
+  const { stdout } = await runSvn(['info', pathOrUrl, '--non-interactive'], { maxBuffer: 1024 * 1024 })
+  const fields = parseSvnInfo(stdout)
+  infoCache.set(pathOrUrl, { expiresAt: Date.now() + INFO_CACHE_TTL_MS, fields })
+  return fields
+}